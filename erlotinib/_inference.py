@@ -528,7 +528,7 @@ class InferenceController(object):
 
             # If number of bottom-level parameters is 0, skip to next iteration
             end_index = start_index + n_indiv
-            if (n_indiv == 0) or np.alltrue(mask[start_index:end_index]):
+            if (n_indiv == 0) or np.all(mask[start_index:end_index]):
                 # Shift start index by total number of hierarchical parameters
                 start_index += n_indiv + n_pop
                 continue
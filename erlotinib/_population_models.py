@@ -10,7 +10,7 @@ import math
 
 from numba import njit
 import numpy as np
-from scipy.stats import norm, truncnorm
+from scipy.stats import truncnorm
 
 
 class PopulationModel(object):
@@ -285,17 +285,27 @@ class LogNormalModel(PopulationModel):
         self._parameter_names = ['Mean log', 'Std. log']
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _compute_log_likelihood(mean, std, observations):  # pragma: no cover
         r"""
         Calculates the log-likelihood using numba speed up.
         """
-        # Compute log-likelihood score
+        # Accumulate the log-transformed observations and their squared
+        # deviations from the mean in a single pass
         n_ids = len(observations)
+        log_observations = 0.0
+        squared_deviations = 0.0
+        for i in range(n_ids):
+            log_observation = np.log(observations[i])
+            log_observations += log_observation
+            deviation = log_observation - mean
+            squared_deviations += deviation * deviation
+
+        # Compute log-likelihood score
         log_likelihood = \
             - n_ids * np.log(2 * np.pi * std**2) / 2 \
-            - np.sum(np.log(observations)) \
-            - np.sum((np.log(observations) - mean)**2) / 2 / std**2
+            - log_observations \
+            - squared_deviations / 2 / std**2
 
         # If score evaluates to NaN, return -infinity
         if np.isnan(log_likelihood):
@@ -304,7 +314,7 @@ class LogNormalModel(PopulationModel):
         return log_likelihood
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _compute_pointwise_ll(mean, std, observations):  # pragma: no cover
         r"""
         Calculates the pointwise log-likelihoods using numba speed up.
@@ -321,7 +331,7 @@ class LogNormalModel(PopulationModel):
         return log_likelihood
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _compute_sensitivities(mean, std, psi):  # pragma: no cover
         r"""
         Calculates the log-likelihood and its sensitivities using numba
@@ -336,26 +346,35 @@ class LogNormalModel(PopulationModel):
         log_likelihood: float
         sensitivities: np.ndarray of shape (n_obs + 2,)
         """
-        # Compute log-likelihood score
+        # Compute sensitivities w.r.t. observations (psi) and accumulate the
+        # sums over the log-transformed observations in the same pass
         n_ids = len(psi)
+        sensitivities = np.empty(shape=n_ids + 2)
+        log_psis = 0.0
+        deviations = 0.0
+        squared_deviations = 0.0
+        for i in range(n_ids):
+            log_psi = np.log(psi[i])
+            deviation = log_psi - mean
+            log_psis += log_psi
+            deviations += deviation
+            squared_deviations += deviation * deviation
+            sensitivities[i] = - (deviation / std**2 + 1) / psi[i]
+
+        # Compute log-likelihood score
         log_likelihood = \
             - n_ids * np.log(2 * np.pi * std**2) / 2 \
-            - np.sum(np.log(psi)) \
-            - np.sum((np.log(psi) - mean)**2) / 2 / std**2
+            - log_psis \
+            - squared_deviations / 2 / std**2
 
         # If score evaluates to NaN, return -infinity
         if np.isnan(log_likelihood):
-            n_obs = len(psi)
-            return -np.inf, np.full(shape=n_obs + 2, fill_value=np.inf)
-
-        # Compute sensitivities w.r.t. observations (psi)
-        dpsi = - ((np.log(psi) - mean) / std**2 + 1) / psi
+            return -np.inf, np.full(shape=n_ids + 2, fill_value=np.inf)
 
         # Copmute sensitivities w.r.t. parameters
-        dmean = np.sum(np.log(psi) - mean) / std**2
-        dstd = (np.sum((np.log(psi) - mean)**2) / std**2 - n_ids) / std
-
-        sensitivities = np.concatenate((dpsi, np.array([dmean, dstd])))
+        sensitivities[n_ids] = deviations / std**2
+        sensitivities[n_ids + 1] = \
+            (squared_deviations / std**2 - n_ids) / std
 
         return log_likelihood, sensitivities
 
@@ -390,14 +409,15 @@ class LogNormalModel(PopulationModel):
             An array like object with the parameter values for the individuals,
             i.e. [:math:`\psi _1, \ldots , \psi _N`].
         """
-        observations = np.asarray(observations)
+        observations = np.asarray(observations, dtype=np.float64)
         mean, std = parameters
 
         if std <= 0:
             # The standard deviation of log psi is strictly positive
             return -np.inf
 
-        return self._compute_log_likelihood(mean, std, observations)
+        return self._compute_log_likelihood(
+            float(mean), float(std), observations)
 
     def compute_pointwise_ll(self, parameters, observations):
         r"""
@@ -425,14 +445,15 @@ class LogNormalModel(PopulationModel):
             An array like object with the parameter values for the individuals,
             i.e. [:math:`\psi _1, \ldots , \psi _N`].
         """
-        observations = np.asarray(observations)
+        observations = np.asarray(observations, dtype=np.float64)
         mean, std = parameters
 
         if std <= 0:
             # The standard deviation of log psi is strictly positive
             return np.full(shape=len(observations), fill_value=-np.inf)
 
-        return self._compute_pointwise_ll(mean, std, observations)
+        return self._compute_pointwise_ll(
+            float(mean), float(std), observations)
 
     def compute_sensitivities(self, parameters, observations):
         r"""
@@ -447,7 +468,7 @@ class LogNormalModel(PopulationModel):
             An array-like object with the observations of the individuals. Each
             entry is assumed to belong to one individual.
         """
-        observations = np.asarray(observations)
+        observations = np.asarray(observations, dtype=np.float64)
         mean, std = parameters
 
         if std <= 0:
@@ -455,7 +476,8 @@ class LogNormalModel(PopulationModel):
             n_obs = len(observations)
             return -np.inf, np.full(shape=(n_obs + 2,), fill_value=np.inf)
 
-        return self._compute_sensitivities(mean, std, observations)
+        return self._compute_sensitivities(
+            float(mean), float(std), observations)
 
     def get_mean_and_std(self, parameters):
         r"""
@@ -630,9 +652,8 @@ class PooledModel(PopulationModel):
 
         # Return -inf if any of the observations does not equal the pooled
         # parameter
-        observations = np.array(observations)
-        mask = observations != parameter
-        if np.any(mask):
+        observations = np.asarray(observations)
+        if not np.all(observations == parameter):
             return -np.inf
 
         # Otherwise return 0
@@ -659,12 +680,10 @@ class PooledModel(PopulationModel):
         # Get the population parameter
         parameter = parameters[0]
 
-        # Return -inf if any of the observations does not equal the pooled
-        # parameter
-        log_likelihood = np.zeros(shape=len(observations))
-        observations = np.array(observations)
-        mask = observations != parameter
-        log_likelihood[mask] = -np.inf
+        # Return -inf for observations that do not equal the pooled
+        # parameter, and 0 otherwise
+        observations = np.asarray(observations)
+        log_likelihood = np.where(observations == parameter, 0.0, -np.inf)
 
         return log_likelihood
 
@@ -686,10 +705,9 @@ class PooledModel(PopulationModel):
 
         # Return -inf if any of the observations does not equal the pooled
         # parameter
-        observations = np.array(observations)
+        observations = np.asarray(observations)
         n_obs = len(observations)
-        mask = observations != parameter
-        if np.any(mask):
+        if not np.all(observations == parameter):
             return -np.inf, np.full(shape=n_obs + 1, fill_value=np.inf)
 
         # Otherwise return 0
@@ -935,7 +953,7 @@ class ReducedPopulationModel(object):
             self._fixed_params_values[index] = value
 
         # If all parameters are free, set mask and values to None again
-        if np.alltrue(~self._fixed_params_mask):
+        if np.all(~self._fixed_params_mask):
             self._fixed_params_mask = None
             self._fixed_params_values = None
 
@@ -1114,7 +1132,7 @@ class TruncatedGaussianModel(PopulationModel):
         self._parameter_names = ['Mu', 'Sigma']
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _compute_log_likelihood(mean, std, observations):  # pragma: no cover
         r"""
         Calculates the log-likelihood using numba speed up.
@@ -1125,11 +1143,18 @@ class TruncatedGaussianModel(PopulationModel):
         ..math::
             Phi(x) = (1 + erf(x/sqrt(2))) / 2
         """
-        # Compute log-likelihood score
+        # Accumulate squared deviations in a single pass, so no temporary
+        # arrays are allocated
         n_ids = len(observations)
+        squared_deviations = 0.0
+        for i in range(n_ids):
+            deviation = observations[i] - mean
+            squared_deviations += deviation * deviation
+
+        # Compute log-likelihood score
         log_likelihood = \
             - n_ids * np.log(2 * np.pi * std**2) / 2 \
-            - np.sum((observations - mean) ** 2) / (2 * std**2) \
+            - squared_deviations / (2 * std**2) \
             - n_ids * np.log(1 - _norm_cdf(-mean/std))
 
         # If score evaluates to NaN, return -infinity
@@ -1139,21 +1164,29 @@ class TruncatedGaussianModel(PopulationModel):
         return log_likelihood
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _compute_pointwise_ll(mean, std, observations):  # pragma: no cover
         r"""
         Calculates the pointwise log-likelihoods using numba speed up.
         """
-        # Compute log-likelihood score
-        log_likelihood = \
+        # The normalisation and the scaling of the squared deviations are
+        # the same for all observations
+        normalisation = \
             - np.log(2 * np.pi * std**2) / 2 \
-            - (observations - mean) ** 2 / (2 * std**2) \
-            - np.log(1 - math.erf(-mean/std/math.sqrt(2))) + np.log(2)
+            - np.log(1 - _norm_cdf(-mean/std))
+        scale = 1 / (2 * std**2)
+
+        # Compute pointwise log-likelihoods in a single pass
+        n_ids = len(observations)
+        log_likelihood = np.empty(shape=n_ids)
+        for i in range(n_ids):
+            deviation = observations[i] - mean
+            log_likelihood[i] = normalisation - deviation * deviation * scale
 
         return log_likelihood
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def _compute_sensitivities(mean, std, psi):  # pragma: no cover
         r"""
         Calculates the log-likelihood and its sensitivities using numba
@@ -1168,33 +1201,36 @@ class TruncatedGaussianModel(PopulationModel):
         log_likelihood: float
         sensitivities: np.ndarray of shape (n_obs + 2,)
         """
-        # Compute log-likelihood score
+        # Compute sensitivities w.r.t. observations (psi) and accumulate the
+        # deviations from the mean in the same pass
         n_ids = len(psi)
+        inv_var = 1 / std**2
+        sensitivities = np.empty(shape=n_ids + 2)
+        deviations = 0.0
+        squared_deviations = 0.0
+        for i in range(n_ids):
+            deviation = psi[i] - mean
+            deviations += deviation
+            squared_deviations += deviation * deviation
+            sensitivities[i] = -deviation * inv_var
+
+        # Compute log-likelihood score
         log_likelihood = \
             - n_ids * (np.log(2 * np.pi) / 2 + np.log(std)) \
-            - np.sum((psi - mean)**2) / (2 * std**2) \
+            - squared_deviations * inv_var / 2 \
             - n_ids * np.log(1 - _norm_cdf(-mean/std))
 
         # If score evaluates to NaN, return -infinity
         if np.isnan(log_likelihood):
-            n_obs = len(psi)
-            return -np.inf, np.full(shape=n_obs + 2, fill_value=np.inf)
-
-        # Compute sensitivities w.r.t. observations (psi)
-        dpsi = (mean - psi) / std**2
+            return -np.inf, np.full(shape=n_ids + 2, fill_value=np.inf)
 
         # Copmute sensitivities w.r.t. parameters
-        dmean = (
-            np.sum(psi - mean) / std
-            - _norm_pdf(mean/std) / (1 - _norm_cdf(-mean/std)) * n_ids
+        ratio = _norm_pdf(mean/std) / (1 - _norm_cdf(-mean/std))
+        sensitivities[n_ids] = deviations * inv_var - ratio * n_ids / std
+        sensitivities[n_ids + 1] = (
+            -n_ids + squared_deviations * inv_var
+            + ratio * mean / std * n_ids
             ) / std
-        dstd = (
-            -n_ids + np.sum((psi - mean)**2) / std**2
-            + _norm_pdf(mean/std) * mean / std / (1 - _norm_cdf(-mean/std))
-            * n_ids
-            ) / std
-
-        sensitivities = np.concatenate((dpsi, np.array([dmean, dstd])))
 
         return log_likelihood, sensitivities
 
@@ -1229,7 +1265,7 @@ class TruncatedGaussianModel(PopulationModel):
             An array like object with the parameter values for the individuals,
             i.e. [:math:`\psi _1, \ldots , \psi _N`].
         """
-        observations = np.asarray(observations)
+        observations = np.asarray(observations, dtype=np.float64)
         mean, std = parameters
 
         if (mean <= 0) or (std <= 0):
@@ -1237,7 +1273,8 @@ class TruncatedGaussianModel(PopulationModel):
             # strictly positive if truncated at zero
             return -np.inf
 
-        return self._compute_log_likelihood(mean, std, observations)
+        return self._compute_log_likelihood(
+            float(mean), float(std), observations)
 
     def compute_pointwise_ll(self, parameters, observations):
         r"""
@@ -1265,7 +1302,7 @@ class TruncatedGaussianModel(PopulationModel):
             An array like object with the parameter values for the individuals,
             i.e. [:math:`\psi _1, \ldots , \psi _N`].
         """
-        observations = np.asarray(observations)
+        observations = np.asarray(observations, dtype=np.float64)
         mean, std = parameters
 
         if (mean <= 0) or (std <= 0):
@@ -1273,7 +1310,8 @@ class TruncatedGaussianModel(PopulationModel):
             # strictly positive if truncated at zero
             return np.full(shape=len(observations), fill_value=-np.inf)
 
-        return self._compute_pointwise_ll(mean, std, observations)
+        return self._compute_pointwise_ll(
+            float(mean), float(std), observations)
 
     def compute_sensitivities(self, parameters, observations):
         r"""
@@ -1288,7 +1326,7 @@ class TruncatedGaussianModel(PopulationModel):
             An array-like object with the observations of the individuals. Each
             entry is assumed to belong to one individual.
         """
-        observations = np.asarray(observations)
+        observations = np.asarray(observations, dtype=np.float64)
         mean, std = parameters
 
         if (mean <= 0) or (std <= 0):
@@ -1297,7 +1335,8 @@ class TruncatedGaussianModel(PopulationModel):
             n_obs = len(observations)
             return -np.inf, np.full(shape=(n_obs + 2,), fill_value=np.inf)
 
-        return self._compute_sensitivities(mean, std, observations)
+        return self._compute_sensitivities(
+            float(mean), float(std), observations)
 
     def get_mean_and_std(self, parameters):
         r"""
@@ -1338,13 +1377,11 @@ class TruncatedGaussianModel(PopulationModel):
                 'The parameters mu and sigma cannot be negative.')
 
         # Compute mean and standard deviation
-        mean = mu + sigma * norm.pdf(mu/sigma) / (1 - norm.cdf(-mu/sigma))
-        std = np.sqrt(
-            sigma**2 * (
-                1 -
-                mu / sigma * norm.pdf(mu/sigma) / (1 - norm.cdf(-mu/sigma))
-                - (norm.pdf(mu/sigma) / (1 - norm.cdf(-mu/sigma)))**2)
-            )
+        # (F(mu/sigma) is evaluated with the module's standard normal
+        # functions to avoid scipy.stats' distribution dispatch)
+        f = _norm_pdf(mu/sigma) / (1 - _norm_cdf(-mu/sigma))
+        mean = mu + sigma * f
+        std = np.sqrt(sigma**2 * (1 - mu / sigma * f - f**2))
 
         return [mean, std]
 
@@ -1413,18 +1450,13 @@ class TruncatedGaussianModel(PopulationModel):
                 'A log-normal distribution only accepts strictly positive '
                 'standard deviations.')
 
-        # Convert seed to int if seed is a rng
-        # (Unfortunately truncated normal is not yet available with numpys
-        # random number generator API)
-        if isinstance(seed, np.random.Generator):
-            # Draw new seed such that rng is propagated, but truncated normal
-            # samples can also be seeded.
-            seed = seed.integers(low=0, high=1E6)
-        np.random.seed(seed)
-
         # Sample from population distribution
+        # (default_rng returns generators unchanged, so a passed rng is
+        # propagated without reseeding numpy's global random state)
+        rng = np.random.default_rng(seed=seed)
         samples = truncnorm.rvs(
-            a=0, b=np.inf, loc=mu, scale=sigma, size=sample_shape)
+            a=0, b=np.inf, loc=mu, scale=sigma, size=sample_shape,
+            random_state=rng)
 
         return samples
 
@@ -1454,7 +1486,7 @@ class TruncatedGaussianModel(PopulationModel):
         self._parameter_names = [str(label) for label in names]
 
 
-@njit
+@njit(cache=True)
 def _norm_cdf(x):  # pragma: no cover
     """
     Returns the cumulative distribution function value of a standard normal
@@ -1463,7 +1495,7 @@ def _norm_cdf(x):  # pragma: no cover
     return 0.5 * (1 + math.erf(x/math.sqrt(2)))
 
 
-@njit
+@njit(cache=True)
 def _norm_pdf(x):  # pragma: no cover
     """
     Returns the probability density function value of a standard normal
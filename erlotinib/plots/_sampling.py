@@ -7,6 +7,7 @@
 
 import copy
 
+import numpy as np
 import pints
 import plotly.colors
 import plotly.graph_objects as go
@@ -89,14 +90,21 @@ class MarginalPosteriorPlot(eplt.MultiSubplotFigure):
         # Get figure
         fig = self._figs[fig_id]
 
+        # Bin samples (only the bins, not the samples, are passed to plotly)
+        counts, centres, widths = self._bin_samples(samples)
+
         # Add trace
         rhat, = diagnostics
         fig.add_trace(
-            go.Histogram(
-                y=samples,
+            go.Bar(
+                x=counts,
+                y=centres,
+                width=widths,
+                orientation='h',
                 name='%s' % str(individual),
                 hovertemplate=(
-                    'Sample: %{y:.2f}<br>' +
+                    'Bin centre: %{y:.2f}<br>' +
+                    'Count: %{x}<br>' +
                     'Rhat: %.02f<br>' % rhat),
                 visible=True,
                 marker=dict(color=color),
@@ -114,6 +122,34 @@ class MarginalPosteriorPlot(eplt.MultiSubplotFigure):
         fig.update_xaxes(
             title_text=str(individual), row=1, col=index+1)
 
+    def _bin_samples(self, samples, max_bins=100):
+        """
+        Returns the counts, centres and widths of the histogram bins of the
+        finite samples.
+
+        The bin width is chosen by numpy's 'auto' rule, but at most
+        ``max_bins`` bins are used. Samples further than three interquartile
+        ranges from the quartiles are clipped into the outermost bins, so
+        single outliers, e.g. of unconverged chains, cannot stretch the bins
+        over the bulk of the samples.
+        """
+        samples = samples[np.isfinite(samples)]
+        if len(samples) == 0:
+            empty = np.empty(shape=0)
+            return empty, empty, empty
+
+        # Clip outliers
+        q25, q75 = np.percentile(samples, [25, 75])
+        iqr = q75 - q25
+        if iqr > 0:
+            samples = np.clip(samples, q25 - 3 * iqr, q75 + 3 * iqr)
+
+        # Bin samples
+        n_bins = len(np.histogram_bin_edges(samples, bins='auto')) - 1
+        counts, edges = np.histogram(samples, bins=min(n_bins, max_bins))
+
+        return counts, (edges[:-1] + edges[1:]) / 2, np.diff(edges)
+
     def _compute_diagnostics(self, data):
         """
         Computes and returns convergence metrics.
@@ -8,6 +8,7 @@
 import unittest
 
 import numpy as np
+import plotly.graph_objects as go
 import xarray as xr
 
 import erlotinib as erlo
@@ -85,6 +86,60 @@ class TestParameterEstimatePlot(unittest.TestCase):
         # Test case III: Add data for pooled posteriors
         self.fig.add_data(self.pooled_samples)
 
+    def test_add_data_binning(self):
+        n_chains = 4
+        n_draws = 1000
+        coords = {
+            'chain': list(range(n_chains)),
+            'draw': list(range(n_draws))}
+
+        # Test case I: Samples with a missing draw and an extreme outlier
+        samples = np.random.normal(size=(n_chains, n_draws))
+        samples[0, 0] = np.nan
+        samples[1, 0] = 1E10
+        samples = xr.Dataset({'Param 1': xr.DataArray(
+            data=samples, dims=['chain', 'draw'], coords=coords)})
+
+        fig = erlo.plots.MarginalPosteriorPlot()
+        fig.add_data(samples)
+
+        # Samples are passed to plotly as binned counts
+        trace = fig._figs[0].data[0]
+        self.assertIsInstance(trace, go.Bar)
+        self.assertEqual(np.sum(trace.x), n_chains * n_draws - 1)
+
+        # The number of bins is bounded, and the outlier does not collapse
+        # the bulk of the samples into a single bin
+        self.assertLessEqual(len(trace.x), 100)
+        self.assertLess(np.max(trace.x), 0.5 * n_chains * n_draws)
+        self.assertGreaterEqual(np.count_nonzero(trace.x), 10)
+
+        # Test case II: Samples with infinite draws
+        samples = np.random.normal(size=(n_chains, n_draws))
+        samples[0, 0] = np.inf
+        samples[1, 0] = -np.inf
+        samples = xr.Dataset({'Param 1': xr.DataArray(
+            data=samples, dims=['chain', 'draw'], coords=coords)})
+
+        fig = erlo.plots.MarginalPosteriorPlot()
+        fig.add_data(samples)
+
+        trace = fig._figs[0].data[0]
+        self.assertEqual(np.sum(trace.x), n_chains * n_draws - 2)
+        self.assertTrue(np.all(np.isfinite(trace.y)))
+
+        # Test case III: No finite samples
+        samples = np.full(shape=(n_chains, n_draws), fill_value=np.nan)
+        samples = xr.Dataset({'Param 1': xr.DataArray(
+            data=samples, dims=['chain', 'draw'], coords=coords)})
+
+        fig = erlo.plots.MarginalPosteriorPlot()
+        fig.add_data(samples)
+
+        trace = fig._figs[0].data[0]
+        self.assertEqual(len(trace.x), 0)
+        self.assertEqual(len(trace.y), 0)
+
     def test_add_data_bad_input(self):
         # Bad type
         data = 'bad type'
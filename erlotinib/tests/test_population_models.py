@@ -5,6 +5,7 @@
 # full license details.
 #
 
+import functools
 import unittest
 
 import numpy as np
@@ -13,6 +14,108 @@ from scipy.stats import norm, truncnorm
 import erlotinib as erlo
 
 
+# Population models are cheap to use but not free to construct, so we build
+# each of them once per test session and share them across test classes.
+_MODEL_CACHE = {}
+
+
+def _get_model(model_class):
+    """
+    Returns the shared instance of the population model class, and creates it
+    on first request.
+    """
+    if model_class not in _MODEL_CACHE:
+        _MODEL_CACHE[model_class] = model_class()
+
+    return _MODEL_CACHE[model_class]
+
+
+def setUpModule():
+    """
+    Instantiates the shared population models.
+    """
+    for model_class in [
+            erlo.HeterogeneousModel, erlo.LogNormalModel, erlo.PooledModel,
+            erlo.PopulationModel, erlo.TruncatedGaussianModel]:
+        _get_model(model_class)
+
+
+def _check_n_hierarchical_parameters(test, model, n_indiv_per_id, n_pop):
+    """
+    Asserts that the model expects ``n_indiv_per_id`` individual parameters
+    per individual and ``n_pop`` population parameters.
+    """
+    for n_ids in [1, 10]:
+        with test.subTest(n_ids=n_ids):
+            test.assertEqual(
+                model.n_hierarchical_parameters(n_ids),
+                (n_indiv_per_id * n_ids, n_pop))
+
+
+def _finite_difference_sensitivities(model, pop_parameters, psis, epsilon):
+    """
+    Returns central finite difference estimates of the sensitivities of the
+    population model's log-likelihood w.r.t. the psis and the population
+    parameters, in the order of ``compute_sensitivities``.
+
+    The log-likelihood is a sum over individuals, so shifting all psis at once
+    yields each psi derivative from the pointwise scores.
+    """
+    pointwise_ll = model.compute_pointwise_ll
+    ref_dpsi = (
+        pointwise_ll(pop_parameters, psis + epsilon)
+        - pointwise_ll(pop_parameters, psis - epsilon)) / (2 * epsilon)
+
+    # Perturb one population parameter at a time along the unit vectors
+    log_likelihood = model.compute_log_likelihood
+    shifts = epsilon * np.eye(len(pop_parameters))
+    ref_dtheta = [
+        (log_likelihood(pop_parameters + shift, psis)
+         - log_likelihood(pop_parameters - shift, psis)) / (2 * epsilon)
+        for shift in shifts]
+
+    return np.concatenate((ref_dpsi, ref_dtheta))
+
+
+@functools.lru_cache(maxsize=None)
+def _log_normal_ref_score(n_ids, mu_log, sigma_log):
+    """
+    Returns the reference log-likelihood of a LogNormalModel when all
+    ``n_ids`` individual parameters are 1.
+
+    For psi = 1 the score reduces to
+    -n_ids * log(2 * pi * sigma_log^2) / 2
+    - n_ids * mu_log^2 / (2 * sigma_log^2)
+    """
+    return -n_ids * (
+        np.log(2 * np.pi * sigma_log**2) + mu_log**2 / sigma_log**2) / 2
+
+
+@functools.lru_cache(maxsize=None)
+def _truncated_gaussian_ref_log_pdfs(psis, mu, sigma):
+    """
+    Returns the reference log-pdfs of a TruncatedGaussianModel evaluated at
+    ``psis``, computed with scipy's truncnorm.
+
+    ``psis`` is passed as a tuple so that repeated fixtures are only evaluated
+    once. The returned array is read-only, since it is shared between calls.
+    """
+    log_pdfs = truncnorm.logpdf(
+        psis, a=-mu / sigma, b=np.inf, loc=mu, scale=sigma)
+    log_pdfs.setflags(write=False)
+
+    return log_pdfs
+
+
+def _truncated_gaussian_ratio(mu, sigma):
+    """
+    Returns phi(mu / sigma) / (1 - Phi(-mu / sigma)), which enters the
+    reference sensitivities of a TruncatedGaussianModel through the
+    normalisation of the truncated distribution.
+    """
+    return norm.pdf(mu / sigma) / norm.sf(-mu / sigma)
+
+
 class TestHeterogeneousModel(unittest.TestCase):
     """
     Tests the erlotinib.HeterogeneousModel class.
@@ -20,7 +123,7 @@ class TestHeterogeneousModel(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.pop_model = erlo.HeterogeneousModel()
+        cls.pop_model = _get_model(erlo.HeterogeneousModel)
 
     def test_compute_log_likelihood(self):
         # For efficiency the input is actually not checked, and 0 is returned
@@ -38,23 +141,14 @@ class TestHeterogeneousModel(unittest.TestCase):
         observations = [0, 1, 1, 1]
         scores = self.pop_model.compute_pointwise_ll(
             parameters, observations)
-        self.assertEqual(len(scores), 4)
-        self.assertEqual(scores[0], 0)
-        self.assertEqual(scores[1], 0)
-        self.assertEqual(scores[2], 0)
-        self.assertEqual(scores[3], 0)
+        np.testing.assert_array_equal(scores, np.zeros(shape=4))
 
         # Test case I.2
         parameters = [1]
         observations = [1, 2, 1, 10, 1]
         scores = self.pop_model.compute_pointwise_ll(
             parameters, observations)
-        self.assertEqual(len(scores), 5)
-        self.assertEqual(scores[0], 0)
-        self.assertEqual(scores[1], 0)
-        self.assertEqual(scores[2], 0)
-        self.assertEqual(scores[3], 0)
-        self.assertEqual(scores[4], 0)
+        np.testing.assert_array_equal(scores, np.zeros(shape=5))
 
     def test_compute_sensitivities(self):
         # For efficiency the input is actually not checked, and 0 is returned
@@ -64,20 +158,14 @@ class TestHeterogeneousModel(unittest.TestCase):
         score, sens = self.pop_model.compute_sensitivities(
             parameters, observations)
         self.assertEqual(score, 0)
-        self.assertEqual(len(sens), 2)
-        self.assertEqual(sens[0], 0)
-        self.assertEqual(sens[1], 0)
+        np.testing.assert_array_equal(sens, np.zeros(shape=2))
 
     def test_get_parameter_names(self):
         self.assertIsNone(self.pop_model.get_parameter_names())
 
     def test_n_hierarchical_parameters(self):
-        n_ids = 10
-        n_hierachical_params = self.pop_model.n_hierarchical_parameters(n_ids)
-
-        self.assertEqual(len(n_hierachical_params), 2)
-        self.assertEqual(n_hierachical_params[0], n_ids)
-        self.assertEqual(n_hierachical_params[1], 0)
+        _check_n_hierarchical_parameters(
+            self, self.pop_model, n_indiv_per_id=1, n_pop=0)
 
     def test_n_parameters(self):
         self.assertEqual(self.pop_model.n_parameters(), 0)
@@ -87,6 +175,8 @@ class TestHeterogeneousModel(unittest.TestCase):
             self.pop_model.sample('some params')
 
     def test_set_get_parameter_names(self):
+        self.addCleanup(self.pop_model.set_parameter_names, None)
+
         # Check default name
         name = self.pop_model.get_parameter_names()
         self.assertIsNone(name)
@@ -96,8 +186,7 @@ class TestHeterogeneousModel(unittest.TestCase):
         self.pop_model.set_parameter_names(name)
         names = self.pop_model.get_parameter_names()
 
-        self.assertEqual(len(names), 1)
-        self.assertEqual(names[0], 'some name')
+        self.assertEqual(names, ['some name'])
 
         # Set to default
         self.pop_model.set_parameter_names(None)
@@ -116,7 +205,8 @@ class TestLogNormalModel(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.pop_model = erlo.LogNormalModel()
+        cls.pop_model = _get_model(erlo.LogNormalModel)
+        cls.rng = np.random.default_rng(seed=42)
 
     def test_compute_log_likelihood(self):
         # Hard to test exactly, but at least test some edge cases where
@@ -124,91 +214,41 @@ class TestLogNormalModel(unittest.TestCase):
 
         n_ids = 10
 
-        # Test case I: psis = 1, sigma_log = 1
-        # Score reduces to
-        # -n_ids * np.log(2*pi) / 2 - n_ids * mu_log^2 / 2
-
-        # Test case I.1:
-        psis = [1] * n_ids
-        mu_log = 1
-        sigma_log = 1
-        ref_score = -n_ids * (np.log(2 * np.pi) + mu_log**2) / 2
-
-        parameters = [mu_log] + [sigma_log]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertEqual(score, ref_score)
-
-        # Test case I.2:
-        psis = [1] * n_ids
-        mu_log = 5
-        sigma_log = 1
-        ref_score = -n_ids * (np.log(2 * np.pi) + mu_log**2) / 2
-
-        parameters = [mu_log] + [sigma_log]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertEqual(score, ref_score)
-
-        # Test case II: psis = 1.
-        # Score reduces to
-        # -n_ids * log(sigma_log) - n_ids * log(2 * pi) / 2
-        # - n_ids * mu_log^2 / (2 * sigma_log^2)
-
-        # Test case II.1:
-        psis = [1] * n_ids
-        mu_log = 1
-        sigma_log = 2
-        ref_score = \
-            -n_ids * (
-                np.log(2 * np.pi * sigma_log**2)
-                + mu_log**2 / sigma_log**2) / 2
-
-        parameters = [mu_log] + [sigma_log]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertEqual(score, ref_score)
-
-        # Test case II.2:
-        psis = [1] * n_ids
-        mu_log = 3
-        sigma_log = np.exp(3)
-        ref_score = \
-            -n_ids * (
-                np.log(2 * np.pi * sigma_log**2)
-                + mu_log**2 / sigma_log**2) / 2
-
-        parameters = [mu_log] + [sigma_log]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertEqual(score, ref_score)
-
-        # Test case III: psis all the same, sigma_log = 1.
-        # Score reduces to
-        # -n_ids * log(psi) - n_ids * np.log(2 * pi) / 2
-        # - n_ids * (log(psi) - mu_log)^2 / 2
-
-        # Test case III.1
-        psis = [np.exp(4)] * n_ids
-        mu_log = 1
-        sigma_log = 1
-        ref_score = \
-            -n_ids * (4 + np.log(2 * np.pi) / 2 + (4 - mu_log)**2 / 2)
-
-        parameters = [mu_log] + [sigma_log]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertEqual(score, ref_score)
-
-        # Test case III.2
-        psis = [np.exp(3)] * n_ids
-        mu_log = 3
-        sigma_log = 1
-        ref_score = -n_ids * (3 + np.log(2 * np.pi) / 2)
-
-        parameters = [mu_log] + [sigma_log]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertEqual(score, ref_score)
+        # Each case is defined by (psi, mu_log, sigma_log, ref_score)
+        cases = [
+            # Test case I: psis = 1, sigma_log = 1
+            # Score reduces to
+            # -n_ids * np.log(2*pi) / 2 - n_ids * mu_log^2 / 2
+            (1.0, 1, 1, _log_normal_ref_score(n_ids, 1, 1)),
+            (1.0, 5, 1, _log_normal_ref_score(n_ids, 5, 1)),
+
+            # Test case II: psis = 1.
+            # Score reduces to
+            # -n_ids * log(sigma_log) - n_ids * log(2 * pi) / 2
+            # - n_ids * mu_log^2 / (2 * sigma_log^2)
+            (1.0, 1, 2, _log_normal_ref_score(n_ids, 1, 2)),
+            (1.0, 3, np.exp(3), _log_normal_ref_score(n_ids, 3, np.exp(3))),
+
+            # Test case III: psis all the same, sigma_log = 1.
+            # Score reduces to
+            # -n_ids * log(psi) - n_ids * np.log(2 * pi) / 2
+            # - n_ids * (log(psi) - mu_log)^2 / 2
+            (np.exp(4), 1, 1, -n_ids * (
+                4 + np.log(2 * np.pi) / 2 + (4 - 1)**2 / 2)),
+            (np.exp(3), 3, 1, -n_ids * (3 + np.log(2 * np.pi) / 2))]
+
+        for psi, mu_log, sigma_log, ref_score in cases:
+            with self.subTest(psi=psi, mu_log=mu_log, sigma_log=sigma_log):
+                psis = np.full(shape=n_ids, fill_value=psi)
+                parameters = [mu_log, sigma_log]
+                score = self.pop_model.compute_log_likelihood(
+                    parameters, psis)
+                self.assertEqual(score, ref_score)
 
         # Test case IV: sigma_log negative or zero
 
         # Test case IV.1
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = 0
 
@@ -217,7 +257,7 @@ class TestLogNormalModel(unittest.TestCase):
         self.assertEqual(score, -np.inf)
 
         # Test case IV.2
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = -10
 
@@ -236,10 +276,10 @@ class TestLogNormalModel(unittest.TestCase):
         # -n_ids * np.log(2*pi) / 2 - n_ids * mu_log^2 / 2
 
         # Test case I.1:
-        psis = [1] * n_ids
+        psis = np.full(shape=n_ids, fill_value=1.0)
         mu_log = 1
         sigma_log = 1
-        ref_score = -n_ids * (np.log(2 * np.pi) + mu_log**2) / 2
+        ref_score = _log_normal_ref_score(n_ids, mu_log, sigma_log)
 
         parameters = [mu_log] + [sigma_log]
         scores = self.pop_model.compute_pointwise_ll(parameters, psis)
@@ -249,10 +289,10 @@ class TestLogNormalModel(unittest.TestCase):
 
         # Test case I.2:
         n_ids = 6
-        psis = [1] * n_ids
+        psis = np.full(shape=n_ids, fill_value=1.0)
         mu_log = 5
         sigma_log = 1
-        ref_score = -n_ids * (np.log(2 * np.pi) + mu_log**2) / 2
+        ref_score = _log_normal_ref_score(n_ids, mu_log, sigma_log)
 
         parameters = [mu_log] + [sigma_log]
         scores = self.pop_model.compute_pointwise_ll(parameters, psis)
@@ -267,13 +307,10 @@ class TestLogNormalModel(unittest.TestCase):
 
         # Test case II.1:
         n_ids = 10
-        psis = [1] * n_ids
+        psis = np.full(shape=n_ids, fill_value=1.0)
         mu_log = 1
         sigma_log = np.exp(2)
-        ref_score = \
-            -n_ids * (
-                np.log(2 * np.pi * sigma_log**2)
-                + mu_log**2 / sigma_log**2) / 2
+        ref_score = _log_normal_ref_score(n_ids, mu_log, sigma_log)
 
         parameters = [mu_log] + [sigma_log]
         scores = self.pop_model.compute_pointwise_ll(parameters, psis)
@@ -282,13 +319,10 @@ class TestLogNormalModel(unittest.TestCase):
         self.assertTrue(np.allclose(scores, ref_score / 10))
 
         # Test case II.2:
-        psis = [1] * n_ids
+        psis = np.full(shape=n_ids, fill_value=1.0)
         mu_log = 3
         sigma_log = np.exp(3)
-        ref_score = \
-            -n_ids * (
-                np.log(2 * np.pi * sigma_log**2)
-                + mu_log**2 / sigma_log**2) / 2
+        ref_score = _log_normal_ref_score(n_ids, mu_log, sigma_log)
 
         parameters = [mu_log] + [sigma_log]
         scores = self.pop_model.compute_pointwise_ll(parameters, psis)
@@ -314,7 +348,7 @@ class TestLogNormalModel(unittest.TestCase):
         # - n_ids * (log(psi) - mu_log)^2 / 2
 
         # Test case III.1
-        psis = [np.exp(4)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(4))
         mu_log = 1
         sigma_log = 1
         ref_score = \
@@ -327,7 +361,7 @@ class TestLogNormalModel(unittest.TestCase):
         self.assertTrue(np.allclose(scores, ref_score / 10))
 
         # Test case III.2
-        psis = [np.exp(3)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(3))
         mu_log = 3
         sigma_log = 1
         ref_score = -n_ids * (3 + np.log(2 * np.pi) / 2)
@@ -341,7 +375,7 @@ class TestLogNormalModel(unittest.TestCase):
         # Test case IV: mu_log or sigma_log negative or zero
 
         # Test case IV.1
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = 0
 
@@ -352,7 +386,7 @@ class TestLogNormalModel(unittest.TestCase):
         self.assertEqual(scores[2], -np.inf)
 
         # Test case IV.2
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = -10
 
@@ -374,244 +408,89 @@ class TestLogNormalModel(unittest.TestCase):
         # dmu = - mu_log * nids
         # dsigma = -(1 + mu_log^2) * nids
 
-        # Test case I.1:
-        psis = [1] * n_ids
-        mu_log = 1
-        sigma_log = 1
-
-        # Compute ref scores
-        parameters = [mu_log] + [sigma_log]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = -1 + mu_log
-        ref_dmu = -mu_log * n_ids
-        ref_dsigma = (mu_log**2 - 1) * n_ids
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertEqual(sens[0], ref_dpsi)
-        self.assertEqual(sens[1], ref_dpsi)
-        self.assertEqual(sens[2], ref_dpsi)
-        self.assertEqual(sens[3], ref_dpsi)
-        self.assertEqual(sens[4], ref_dpsi)
-        self.assertEqual(sens[5], ref_dpsi)
-        self.assertEqual(sens[6], ref_dpsi)
-        self.assertEqual(sens[7], ref_dpsi)
-        self.assertEqual(sens[8], ref_dpsi)
-        self.assertEqual(sens[9], ref_dpsi)
-        self.assertEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
-        # Test case I.2:
-        psis = [1] * n_ids
-        mu_log = 5
-        sigma_log = 1
-
-        # Compute ref scores
-        parameters = [mu_log] + [sigma_log]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = -1 + mu_log
-        ref_dmu = -mu_log * n_ids
-        ref_dsigma = (mu_log**2 - 1) * n_ids
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertEqual(sens[0], ref_dpsi)
-        self.assertEqual(sens[1], ref_dpsi)
-        self.assertEqual(sens[2], ref_dpsi)
-        self.assertEqual(sens[3], ref_dpsi)
-        self.assertEqual(sens[4], ref_dpsi)
-        self.assertEqual(sens[5], ref_dpsi)
-        self.assertEqual(sens[6], ref_dpsi)
-        self.assertEqual(sens[7], ref_dpsi)
-        self.assertEqual(sens[8], ref_dpsi)
-        self.assertEqual(sens[9], ref_dpsi)
-        self.assertEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
         # Test case II: psis = 1.
         # Sensitivities reduce to
         # dpsi = -1 + mu_log / var_log
         # dmu = - mu_log / var_log * nids
         # dsigma = (mu_log^2 / var_log - 1) / std_log * nids
-
-        # Test case II.1:
-        psis = [1] * n_ids
-        mu_log = 1
-        sigma_log = np.exp(2)
-
-        # Compute ref scores
-        parameters = [mu_log] + [sigma_log]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = -1 + mu_log / sigma_log**2
-        ref_dmu = -mu_log / sigma_log**2 * n_ids
-        ref_dsigma = (mu_log**2 / sigma_log**2 - 1) / sigma_log * n_ids
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertEqual(sens[0], ref_dpsi)
-        self.assertEqual(sens[1], ref_dpsi)
-        self.assertEqual(sens[2], ref_dpsi)
-        self.assertEqual(sens[3], ref_dpsi)
-        self.assertEqual(sens[4], ref_dpsi)
-        self.assertEqual(sens[5], ref_dpsi)
-        self.assertEqual(sens[6], ref_dpsi)
-        self.assertEqual(sens[7], ref_dpsi)
-        self.assertEqual(sens[8], ref_dpsi)
-        self.assertEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
-        # Test case II.2:
-        psis = [1] * n_ids
-        mu_log = 3
-        sigma_log = np.exp(3)
-
-        # Compute ref scores
-        parameters = [mu_log] + [sigma_log]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = -1 + mu_log / sigma_log**2
-        ref_dmu = -mu_log / sigma_log**2 * n_ids
-        ref_dsigma = (mu_log**2 / sigma_log**2 - 1) / sigma_log * n_ids
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertEqual(sens[0], ref_dpsi)
-        self.assertEqual(sens[1], ref_dpsi)
-        self.assertEqual(sens[2], ref_dpsi)
-        self.assertEqual(sens[3], ref_dpsi)
-        self.assertEqual(sens[4], ref_dpsi)
-        self.assertEqual(sens[5], ref_dpsi)
-        self.assertEqual(sens[6], ref_dpsi)
-        self.assertEqual(sens[7], ref_dpsi)
-        self.assertEqual(sens[8], ref_dpsi)
-        self.assertEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
+        cases = [(1, 1), (5, 1), (1, np.exp(2)), (3, np.exp(3))]
+        for mu_log, sigma_log in cases:
+            with self.subTest(mu_log=mu_log, sigma_log=sigma_log):
+                psis = np.full(shape=n_ids, fill_value=1.0)
+
+                # Compute ref scores
+                parameters = [mu_log, sigma_log]
+                ref_ll = self.pop_model.compute_log_likelihood(
+                    parameters, psis)
+                ref_dpsi = -1 + mu_log / sigma_log**2
+                ref_dmu = -mu_log / sigma_log**2 * n_ids
+                ref_dsigma = \
+                    (mu_log**2 / sigma_log**2 - 1) / sigma_log * n_ids
+
+                # Compute log-likelihood and sensitivities
+                score, sens = self.pop_model.compute_sensitivities(
+                    parameters, psis)
+
+                self.assertEqual(score, ref_ll)
+                self.assertEqual(len(sens), n_ids + 2)
+                np.testing.assert_array_equal(
+                    sens[:n_ids], np.full(shape=n_ids, fill_value=ref_dpsi))
+                self.assertAlmostEqual(sens[10], ref_dmu)
+                self.assertAlmostEqual(sens[11], ref_dsigma)
 
         # Test case III: psis all the same, sigma_log = 1.
         # Score reduces to
         # dpsi = (-1 + mu_log - log psi) / psi
         # dmu = (log psi - mu_log) * nids
         # dsigma = ((log psi - mu_log)^2 - 1) * nids
-
-        # Test case III.1
-        psi = [np.exp(4)] * n_ids
-        mu_log = 1
-        sigma_log = 1
-
-        # Compute ref scores
-        parameters = [mu_log] + [sigma_log]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psi)
-        ref_dpsi = (-1 + mu_log - np.log(psi[0])) / psi[0]
-        ref_dmu = (np.log(psi[0]) - mu_log) * n_ids
-        ref_dsigma = ((np.log(psi[0]) - mu_log)**2 - 1) * n_ids
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psi)
-
-        self.assertEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertEqual(sens[0], ref_dpsi)
-        self.assertEqual(sens[1], ref_dpsi)
-        self.assertEqual(sens[2], ref_dpsi)
-        self.assertEqual(sens[3], ref_dpsi)
-        self.assertEqual(sens[4], ref_dpsi)
-        self.assertEqual(sens[5], ref_dpsi)
-        self.assertEqual(sens[6], ref_dpsi)
-        self.assertEqual(sens[7], ref_dpsi)
-        self.assertEqual(sens[8], ref_dpsi)
-        self.assertEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
-        # Test case III.2
-        psi = [np.exp(3)] * n_ids
-        mu_log = 3
-        sigma_log = 1
-
-        # Compute ref scores
-        parameters = [mu_log] + [sigma_log]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psi)
-        ref_dpsi = (-1 + mu_log - np.log(psi[0])) / psi[0]
-        ref_dmu = (np.log(psi[0]) - mu_log) * n_ids
-        ref_dsigma = ((np.log(psi[0]) - mu_log)**2 - 1) * n_ids
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psi)
-
-        self.assertEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertEqual(sens[0], ref_dpsi)
-        self.assertEqual(sens[1], ref_dpsi)
-        self.assertEqual(sens[2], ref_dpsi)
-        self.assertEqual(sens[3], ref_dpsi)
-        self.assertEqual(sens[4], ref_dpsi)
-        self.assertEqual(sens[5], ref_dpsi)
-        self.assertEqual(sens[6], ref_dpsi)
-        self.assertEqual(sens[7], ref_dpsi)
-        self.assertEqual(sens[8], ref_dpsi)
-        self.assertEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
-        # Test case IV: Compare gradients to numpy.gradient
+        cases = [(np.exp(4), 1), (np.exp(3), 3)]
+        for psi, mu_log in cases:
+            with self.subTest(psi=psi, mu_log=mu_log):
+                psis = np.full(shape=n_ids, fill_value=psi)
+                sigma_log = 1
+
+                # Compute ref scores
+                parameters = [mu_log, sigma_log]
+                ref_ll = self.pop_model.compute_log_likelihood(
+                    parameters, psis)
+                ref_dpsi = (-1 + mu_log - np.log(psi)) / psi
+                ref_dmu = (np.log(psi) - mu_log) * n_ids
+                ref_dsigma = ((np.log(psi) - mu_log)**2 - 1) * n_ids
+
+                # Compute log-likelihood and sensitivities
+                score, sens = self.pop_model.compute_sensitivities(
+                    parameters, psis)
+
+                self.assertEqual(score, ref_ll)
+                self.assertEqual(len(sens), n_ids + 2)
+                np.testing.assert_array_equal(
+                    sens[:n_ids], np.full(shape=n_ids, fill_value=ref_dpsi))
+                self.assertAlmostEqual(sens[10], ref_dmu)
+                self.assertAlmostEqual(sens[11], ref_dsigma)
+
+        # Test case IV: Compare gradients to central finite differences
         epsilon = 0.00001
         n_parameters = n_ids + self.pop_model.n_parameters()
         parameters = np.full(shape=n_parameters, fill_value=0.3)
-        ref_sens = []
-        for index in range(n_parameters):
-            # Construct parameter grid
-            low = parameters.copy()
-            low[index] -= epsilon
-            high = parameters.copy()
-            high[index] += epsilon
-
-            # Compute reference using numpy.gradient
-            sens = np.gradient(
-                [
-                    self.pop_model.compute_log_likelihood(
-                        low[n_ids:], low[:n_ids]),
-                    self.pop_model.compute_log_likelihood(
-                        parameters[n_ids:], parameters[:n_ids]),
-                    self.pop_model.compute_log_likelihood(
-                        high[n_ids:], high[:n_ids])],
-                (epsilon))
-            ref_sens.append(sens[1])
+        psis = parameters[:n_ids]
+        pop_parameters = parameters[n_ids:]
+
+        ref_sens = _finite_difference_sensitivities(
+            self.pop_model, pop_parameters, psis, epsilon)
 
         # Compute sensitivities with hierarchical model
-        _, sens = self.pop_model.compute_sensitivities(
-            parameters[n_ids:], parameters[:n_ids])
+        _, sens = self.pop_model.compute_sensitivities(pop_parameters, psis)
 
         self.assertEqual(len(sens), 12)
-        self.assertAlmostEqual(sens[0], ref_sens[0])
-        self.assertAlmostEqual(sens[1], ref_sens[1])
-        self.assertAlmostEqual(sens[2], ref_sens[2])
-        self.assertAlmostEqual(sens[3], ref_sens[3])
-        self.assertAlmostEqual(sens[4], ref_sens[4])
-        self.assertAlmostEqual(sens[5], ref_sens[5])
-        self.assertAlmostEqual(sens[6], ref_sens[6])
-        self.assertAlmostEqual(sens[7], ref_sens[7])
-        self.assertAlmostEqual(sens[8], ref_sens[8])
-        self.assertAlmostEqual(sens[9], ref_sens[9])
-        self.assertAlmostEqual(sens[10], ref_sens[10], 5)
-        self.assertAlmostEqual(sens[11], ref_sens[11], 5)
+        np.testing.assert_allclose(
+            sens[:n_ids], ref_sens[:n_ids], rtol=0, atol=1E-7)
+        np.testing.assert_allclose(
+            sens[n_ids:], ref_sens[n_ids:], rtol=0, atol=1E-5)
 
         # Test case V: mu_log or sigma_log negative or zero
 
         # Test case V.1
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = 0
 
@@ -623,7 +502,7 @@ class TestLogNormalModel(unittest.TestCase):
         self.assertEqual(sens[2], np.inf)
 
         # Test case V.2
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = -10
 
@@ -706,33 +585,22 @@ class TestLogNormalModel(unittest.TestCase):
         self.assertEqual(self.pop_model.get_parameter_names(), names)
 
     def test_n_hierarchical_parameters(self):
-        n_ids = 10
-        n_hierarchical_params = self.pop_model.n_hierarchical_parameters(n_ids)
-
-        self.assertEqual(len(n_hierarchical_params), 2)
-        self.assertEqual(n_hierarchical_params[0], n_ids)
-        self.assertEqual(n_hierarchical_params[1], 2)
+        _check_n_hierarchical_parameters(
+            self, self.pop_model, n_indiv_per_id=1, n_pop=2)
 
     def test_n_parameters(self):
         self.assertEqual(self.pop_model.n_parameters(), 2)
 
     def test_sample(self):
-        # Test I: sample size 1
-        seed = 42
+        # Each case is a sample size: a single sample (None) and several
         parameters = [3, 2]
-        sample = self.pop_model.sample(parameters, seed=seed)
+        for n_samples in [None, 4]:
+            with self.subTest(n_samples=n_samples):
+                sample = self.pop_model.sample(
+                    parameters, n_samples=n_samples, seed=self.rng)
 
-        n_samples = 1
-        self.assertEqual(sample.shape, (n_samples,))
-
-        # Test II: sample size > 1
-        parameters = [3, 2]
-        n_samples = 4
-        sample = self.pop_model.sample(
-            parameters, n_samples=n_samples, seed=seed)
-
-        self.assertEqual(
-            sample.shape, (n_samples,))
+                n_ref = 1 if n_samples is None else n_samples
+                self.assertEqual(sample.shape, (n_ref,))
 
     def test_sample_bad_input(self):
         # Too many paramaters
@@ -748,6 +616,8 @@ class TestLogNormalModel(unittest.TestCase):
             self.pop_model.sample(parameters)
 
     def test_set_parameter_names(self):
+        self.addCleanup(self.pop_model.set_parameter_names, None)
+
         # Test some name
         names = ['test', 'name']
         self.pop_model.set_parameter_names(names)
@@ -759,9 +629,7 @@ class TestLogNormalModel(unittest.TestCase):
         self.pop_model.set_parameter_names(None)
         names = self.pop_model.get_parameter_names()
 
-        self.assertEqual(len(names), 2)
-        self.assertEqual(names[0], 'Mean log')
-        self.assertEqual(names[1], 'Std. log')
+        self.assertEqual(names, ['Mean log', 'Std. log'])
 
     def test_set_parameter_names_bad_input(self):
         # Wrong number of names
@@ -777,7 +645,7 @@ class TestPooledModel(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.pop_model = erlo.PooledModel()
+        cls.pop_model = _get_model(erlo.PooledModel)
 
     def test_compute_log_likelihood(self):
         # Test case I: observation differ from parameter
@@ -795,7 +663,7 @@ class TestPooledModel(unittest.TestCase):
 
         # Test case II: all values agree with parameter
         parameters = [1]
-        observations = [1, 1, 1, 1]
+        observations = np.ones(shape=4)
         score = self.pop_model.compute_log_likelihood(parameters, observations)
         self.assertEqual(score, 0)
 
@@ -806,33 +674,21 @@ class TestPooledModel(unittest.TestCase):
         observations = [0, 1, 1, 1]
         scores = self.pop_model.compute_pointwise_ll(
             parameters, observations)
-        self.assertEqual(len(scores), 4)
-        self.assertEqual(scores[0], -np.inf)
-        self.assertEqual(scores[1], 0)
-        self.assertEqual(scores[2], 0)
-        self.assertEqual(scores[3], 0)
+        np.testing.assert_array_equal(scores, [-np.inf, 0, 0, 0])
 
         # Test case I.2
         parameters = [1]
         observations = [1, 2, 1, 10, 1]
         scores = self.pop_model.compute_pointwise_ll(
             parameters, observations)
-        self.assertEqual(len(scores), 5)
-        self.assertEqual(scores[0], 0)
-        self.assertEqual(scores[1], -np.inf)
-        self.assertEqual(scores[2], 0)
-        self.assertEqual(scores[3], -np.inf)
-        self.assertEqual(scores[4], 0)
+        np.testing.assert_array_equal(scores, [0, -np.inf, 0, -np.inf, 0])
 
         # Test case II: all values agree with parameter
         parameters = [1]
-        observations = [1, 1, 1]
+        observations = np.ones(shape=3)
         scores = self.pop_model.compute_pointwise_ll(
             parameters, observations)
-        self.assertEqual(len(scores), 3)
-        self.assertEqual(scores[0], 0)
-        self.assertEqual(scores[1], 0)
-        self.assertEqual(scores[2], 0)
+        np.testing.assert_array_equal(scores, np.zeros(shape=3))
 
     def test_compute_sensitivities(self):
         # Test case I: observation differ from parameter
@@ -842,12 +698,8 @@ class TestPooledModel(unittest.TestCase):
         score, sens = self.pop_model.compute_sensitivities(
             parameters, observations)
         self.assertEqual(score, -np.inf)
-        self.assertEqual(len(sens), 5)
-        self.assertEqual(sens[0], np.inf)
-        self.assertEqual(sens[1], np.inf)
-        self.assertEqual(sens[2], np.inf)
-        self.assertEqual(sens[3], np.inf)
-        self.assertEqual(sens[4], np.inf)
+        np.testing.assert_array_equal(
+            sens, np.full(shape=5, fill_value=np.inf))
 
         # Test case I.1
         parameters = [1]
@@ -855,25 +707,16 @@ class TestPooledModel(unittest.TestCase):
         score, sens = self.pop_model.compute_sensitivities(
             parameters, observations)
         self.assertEqual(score, -np.inf)
-        self.assertEqual(len(sens), 5)
-        self.assertEqual(sens[0], np.inf)
-        self.assertEqual(sens[1], np.inf)
-        self.assertEqual(sens[2], np.inf)
-        self.assertEqual(sens[3], np.inf)
-        self.assertEqual(sens[4], np.inf)
+        np.testing.assert_array_equal(
+            sens, np.full(shape=5, fill_value=np.inf))
 
         # Test case II: all values agree with parameter
         parameters = [1]
-        observations = [1, 1, 1, 1]
+        observations = np.ones(shape=4)
         score, sens = self.pop_model.compute_sensitivities(
             parameters, observations)
         self.assertEqual(score, 0)
-        self.assertEqual(len(sens), 5)
-        self.assertEqual(sens[0], 0)
-        self.assertEqual(sens[1], 0)
-        self.assertEqual(sens[2], 0)
-        self.assertEqual(sens[3], 0)
-        self.assertEqual(sens[4], 0)
+        np.testing.assert_array_equal(sens, np.zeros(shape=5))
 
     def test_get_parameter_names(self):
         names = ['Pooled']
@@ -881,12 +724,8 @@ class TestPooledModel(unittest.TestCase):
         self.assertEqual(self.pop_model.get_parameter_names(), names)
 
     def test_n_hierarchical_parameters(self):
-        n_ids = 10
-        n_hierarchical_params = self.pop_model.n_hierarchical_parameters(n_ids)
-
-        self.assertEqual(len(n_hierarchical_params), 2)
-        self.assertEqual(n_hierarchical_params[0], 0)
-        self.assertEqual(n_hierarchical_params[1], 1)
+        _check_n_hierarchical_parameters(
+            self, self.pop_model, n_indiv_per_id=0, n_pop=1)
 
     def test_n_parameters(self):
         self.assertEqual(self.pop_model.n_parameters(), 1)
@@ -920,6 +759,8 @@ class TestPooledModel(unittest.TestCase):
             self.pop_model.sample(parameters)
 
     def test_set_parameter_names(self):
+        self.addCleanup(self.pop_model.set_parameter_names, None)
+
         # Test some name
         names = ['test name']
         self.pop_model.set_parameter_names(names)
@@ -931,8 +772,7 @@ class TestPooledModel(unittest.TestCase):
         self.pop_model.set_parameter_names(None)
         names = self.pop_model.get_parameter_names()
 
-        self.assertEqual(len(names), 1)
-        self.assertEqual(names[0], 'Pooled')
+        self.assertEqual(names, ['Pooled'])
 
     def test_set_parameter_names_bad_input(self):
         # Wrong number of names
@@ -948,7 +788,7 @@ class TestPopulationModel(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.pop_model = erlo.PopulationModel()
+        cls.pop_model = _get_model(erlo.PopulationModel)
 
     def test_compute_log_likelihood(self):
         parameters = 'some parameters'
@@ -995,10 +835,11 @@ class TestReducedPopulationModel(unittest.TestCase):
     Tests the erlotinib.ReducedPopulationModel class.
     """
 
-    @classmethod
-    def setUpClass(cls):
+    def setUp(self):
+        # Tests fix parameters and rename the population model, so each test
+        # gets a fresh model instead of restoring a shared one
         pop_model = erlo.LogNormalModel()
-        cls.pop_model = erlo.ReducedPopulationModel(pop_model)
+        self.pop_model = erlo.ReducedPopulationModel(pop_model)
 
     def test_bad_instantiation(self):
         model = 'Bad type'
@@ -1024,10 +865,6 @@ class TestReducedPopulationModel(unittest.TestCase):
 
         self.assertEqual(score, ref_score)
 
-        # Unfix model parameters
-        self.pop_model.fix_parameters(name_value_dict={
-            'Mean log': None})
-
     def test_compute_pointwise_ll(self):
         # Test case I: fix some parameters
         self.pop_model.fix_parameters(name_value_dict={
@@ -1046,14 +883,7 @@ class TestReducedPopulationModel(unittest.TestCase):
             parameters, observations)
 
         self.assertEqual(len(scores), 4)
-        self.assertEqual(scores[0], ref_scores[0])
-        self.assertEqual(scores[1], ref_scores[1])
-        self.assertEqual(scores[2], ref_scores[2])
-        self.assertEqual(scores[3], ref_scores[3])
-
-        # Unfix model parameters
-        self.pop_model.fix_parameters(name_value_dict={
-            'Mean log': None})
+        np.testing.assert_array_equal(scores, ref_scores)
 
     def test_compute_sensitivities(self):
         # Test case I: fix some parameters
@@ -1072,13 +902,9 @@ class TestReducedPopulationModel(unittest.TestCase):
         ref_score, ref_sens = error_model.compute_sensitivities(
             parameters, observations)
 
+        # The sensitivity w.r.t. the fixed mean (index 4) is dropped
         self.assertEqual(score, ref_score)
-        self.assertEqual(len(sens), 5)
-        self.assertEqual(sens[0], ref_sens[0])
-        self.assertEqual(sens[1], ref_sens[1])
-        self.assertEqual(sens[2], ref_sens[2])
-        self.assertEqual(sens[3], ref_sens[3])
-        self.assertEqual(sens[4], ref_sens[5])
+        np.testing.assert_array_equal(sens, ref_sens[[0, 1, 2, 3, 5]])
 
         # Unfix model parameters
         self.pop_model.fix_parameters(name_value_dict={
@@ -1090,12 +916,7 @@ class TestReducedPopulationModel(unittest.TestCase):
 
         self.assertEqual(score, ref_score)
         self.assertEqual(len(sens), 6)
-        self.assertEqual(sens[0], ref_sens[0])
-        self.assertEqual(sens[1], ref_sens[1])
-        self.assertEqual(sens[2], ref_sens[2])
-        self.assertEqual(sens[3], ref_sens[3])
-        self.assertEqual(sens[4], ref_sens[4])
-        self.assertEqual(sens[5], ref_sens[5])
+        np.testing.assert_array_equal(sens, ref_sens)
 
     def test_fix_parameters(self):
         # Test case I: fix some parameters
@@ -1106,8 +927,7 @@ class TestReducedPopulationModel(unittest.TestCase):
         self.assertEqual(n_parameters, 1)
 
         parameter_names = self.pop_model.get_parameter_names()
-        self.assertEqual(len(parameter_names), 1)
-        self.assertEqual(parameter_names[0], 'Std. log')
+        self.assertEqual(parameter_names, ['Std. log'])
 
         # Test case II: fix overlapping set of parameters
         self.pop_model.fix_parameters(name_value_dict={
@@ -1129,9 +949,7 @@ class TestReducedPopulationModel(unittest.TestCase):
         self.assertEqual(n_parameters, 2)
 
         parameter_names = self.pop_model.get_parameter_names()
-        self.assertEqual(len(parameter_names), 2)
-        self.assertEqual(parameter_names[0], 'Mean log')
-        self.assertEqual(parameter_names[1], 'Std. log')
+        self.assertEqual(parameter_names, ['Mean log', 'Std. log'])
 
     def test_fix_parameters_bad_input(self):
         name_value_dict = 'Bad type'
@@ -1196,14 +1014,7 @@ class TestReducedPopulationModel(unittest.TestCase):
 
         self.assertEqual(samples.shape, (4,))
         self.assertEqual(ref_samples.shape, (4,))
-        self.assertEqual(samples[0], ref_samples[0])
-        self.assertEqual(samples[1], ref_samples[1])
-        self.assertEqual(samples[2], ref_samples[2])
-        self.assertEqual(samples[3], ref_samples[3])
-
-        # Unfix model parameters
-        self.pop_model.fix_parameters(name_value_dict={
-            'Mean log': None})
+        np.testing.assert_array_equal(samples, ref_samples)
 
     def test_set_get_parameter_names(self):
         # Set some parameter names
@@ -1211,17 +1022,13 @@ class TestReducedPopulationModel(unittest.TestCase):
         self.pop_model.set_parameter_names(names)
 
         names = self.pop_model.get_parameter_names()
-        self.assertEqual(len(names), 2)
-        self.assertEqual(names[0], 'Test 1')
-        self.assertEqual(names[1], 'Test 2')
+        self.assertEqual(names, ['Test 1', 'Test 2'])
 
         # Reset to defaults
         self.pop_model.set_parameter_names(None)
 
         names = self.pop_model.get_parameter_names()
-        self.assertEqual(len(names), 2)
-        self.assertEqual(names[0], 'Mean log')
-        self.assertEqual(names[1], 'Std. log')
+        self.assertEqual(names, ['Mean log', 'Std. log'])
 
         # Fix parameter and set parameter name
         self.pop_model.fix_parameters(name_value_dict={
@@ -1230,19 +1037,13 @@ class TestReducedPopulationModel(unittest.TestCase):
             ['Std. log myokit.tumour_volume'])
 
         names = self.pop_model.get_parameter_names()
-        self.assertEqual(len(names), 1)
-        self.assertEqual(names[0], 'Std. log myokit.tumour_volume')
+        self.assertEqual(names, ['Std. log myokit.tumour_volume'])
 
         # Reset to defaults
         self.pop_model.set_parameter_names(None)
 
         names = self.pop_model.get_parameter_names()
-        self.assertEqual(len(names), 1)
-        self.assertEqual(names[0], 'Std. log')
-
-        # Unfix model parameters
-        self.pop_model.fix_parameters(name_value_dict={
-            'Mean log': None})
+        self.assertEqual(names, ['Std. log'])
 
     def test_set_parameter_names_bad_input(self):
         # Wrong number of names
@@ -1265,7 +1066,14 @@ class TestTruncatedGaussianModel(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.pop_model = erlo.TruncatedGaussianModel()
+        cls.pop_model = _get_model(erlo.TruncatedGaussianModel)
+        cls.rng = np.random.default_rng(seed=42)
+
+        # Inputs shared by the tests. They are not flagged read-only, because
+        # numba would compile separate kernels for read-only arrays, so tests
+        # must copy them before mutating
+        cls.psis = np.arange(10, dtype=np.float64)
+        cls.parameters = np.ones(shape=10 + cls.pop_model.n_parameters())
 
     def test_compute_log_likelihood(self):
         # Hard to test exactly, but at least test some edge cases where
@@ -1273,108 +1081,51 @@ class TestTruncatedGaussianModel(unittest.TestCase):
 
         n_ids = 10
 
-        # Test case I: psis = 1, mu = 1, sigma = 1
-        # Score reduces to
-        # -nids * (np.log(2pi)/2 + np.log(1 - Phi(-1)))
-
-        # Test case I.1:
-        psis = [1] * n_ids
-        mu = 1
-        sigma = 1
-        ref_score1 = - n_ids * (
-            np.log(2*np.pi) / 2 + np.log(1 - norm.cdf(-mu/sigma)))
-        a = (0 - mu) / sigma
-        ref_score2 = np.sum(truncnorm.logpdf(
-            psis, a=a, b=np.inf, loc=mu, scale=sigma))
-
-        parameters = [mu, sigma]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertAlmostEqual(score, ref_score1)
-        self.assertAlmostEqual(score, ref_score2)
-
-        # Test case I.2:
-        psis = [5] * n_ids
-        mu = 5
-        sigma = 1
-        ref_score1 = - n_ids * (
-            np.log(2*np.pi) / 2 + np.log(1 - norm.cdf(-mu/sigma)))
-        a = (0 - mu) / sigma
-        ref_score2 = np.sum(truncnorm.logpdf(
-            psis, a=a, b=np.inf, loc=mu, scale=sigma))
-
-        parameters = [mu, sigma]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertAlmostEqual(score, ref_score1)
-        self.assertAlmostEqual(score, ref_score2)
-
-        # Test case II: psis != mu, sigma = 1.
-        # Score reduces to
-        # -nids * (np.log(2pi)/2 + (psi - mu)^2/2 + np.log(1 - Phi(-mu)))
-
-        # Test case II.1:
-        psis = [2] * n_ids
-        mu = 1
-        sigma = 1
-        ref_score1 = - n_ids * (
-            np.log(2*np.pi) / 2 +
-            (psis[0] - mu)**2 / 2 +
-            np.log(1 - norm.cdf(-mu/sigma)))
-        a = (0 - mu) / sigma
-        ref_score2 = np.sum(truncnorm.logpdf(
-            psis, a=a, b=np.inf, loc=mu, scale=sigma))
-
-        parameters = [mu, sigma]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertAlmostEqual(score, ref_score1)
-        self.assertAlmostEqual(score, ref_score2)
-
-        # Test case II.2:
-        psis = [2] * n_ids
-        mu = 10
-        sigma = 1
-        ref_score1 = - n_ids * (
-            np.log(2*np.pi) / 2 +
-            (psis[0] - mu)**2 / 2 +
-            np.log(1 - norm.cdf(-mu/sigma)))
-        a = (0 - mu) / sigma
-        ref_score2 = np.sum(truncnorm.logpdf(
-            psis, a=a, b=np.inf, loc=mu, scale=sigma))
-
-        parameters = [mu, sigma]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertAlmostEqual(score, ref_score1)
-        self.assertAlmostEqual(score, ref_score2)
+        # Each case is defined by (psi, mu), with sigma = 1
+        cases = [
+            # Test case I: psis = mu
+            # Score reduces to
+            # -nids * (np.log(2pi)/2 + np.log(1 - Phi(-mu)))
+            (1.0, 1), (5.0, 5),
+
+            # Test case II: psis != mu
+            # Score reduces to
+            # -nids * (np.log(2pi)/2 + (psi - mu)^2/2 + np.log(1 - Phi(-mu)))
+            (2.0, 1), (2.0, 10)]
+        for psi, mu in cases:
+            with self.subTest(psi=psi, mu=mu):
+                psis = np.full(shape=n_ids, fill_value=psi)
+                sigma = 1
+                ref_score1 = - n_ids * (
+                    np.log(2*np.pi) / 2 +
+                    (psi - mu)**2 / 2 +
+                    norm.logsf(-mu/sigma))
+                ref_score2 = np.sum(
+                    _truncated_gaussian_ref_log_pdfs(tuple(psis), mu, sigma))
+
+                parameters = [mu, sigma]
+                score = self.pop_model.compute_log_likelihood(
+                    parameters, psis)
+                self.assertAlmostEqual(score, ref_score1)
+                self.assertAlmostEqual(score, ref_score2)
 
         # Test case III: Any parameters
-
-        # Test case III.1
-        psis = np.arange(10)
-        mu = 1
-        sigma = 1
-        a = (0 - mu) / sigma
-        ref_score = np.sum(truncnorm.logpdf(
-            psis, a=a, b=np.inf, loc=mu, scale=sigma))
-
-        parameters = [mu, sigma]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertAlmostEqual(score, ref_score)
-
-        # Test case III.2
-        psis = np.arange(10)
-        mu = 10
-        sigma = 15
-        a = (0 - mu) / sigma
-        ref_score = np.sum(truncnorm.logpdf(
-            psis, a=a, b=np.inf, loc=mu, scale=sigma))
-
-        parameters = [mu, sigma]
-        score = self.pop_model.compute_log_likelihood(parameters, psis)
-        self.assertAlmostEqual(score, ref_score)
+        cases = [(1, 1), (10, 15)]
+        for mu, sigma in cases:
+            with self.subTest(mu=mu, sigma=sigma):
+                psis = self.psis
+                ref_score = np.sum(
+                    _truncated_gaussian_ref_log_pdfs(tuple(psis), mu, sigma))
+
+                parameters = [mu, sigma]
+                score = self.pop_model.compute_log_likelihood(
+                    parameters, psis)
+                self.assertAlmostEqual(score, ref_score)
 
         # Test case IV: mu and sigma negative or zero
 
         # Test case IV.1
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 0
         sigma = 1
 
@@ -1383,7 +1134,7 @@ class TestTruncatedGaussianModel(unittest.TestCase):
         self.assertEqual(score, -np.inf)
 
         # Test case IV.2
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = 0
 
@@ -1392,7 +1143,7 @@ class TestTruncatedGaussianModel(unittest.TestCase):
         self.assertEqual(score, -np.inf)
 
         # Test case IV.3
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = -1
         sigma = 1
 
@@ -1401,7 +1152,7 @@ class TestTruncatedGaussianModel(unittest.TestCase):
         self.assertEqual(score, -np.inf)
 
         # Test case IV.4
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = -1
 
@@ -1411,57 +1162,37 @@ class TestTruncatedGaussianModel(unittest.TestCase):
 
     def test_compute_pointwise_ll(self):
         # Test case I.1:
-        psis = np.arange(10)
+        psis = self.psis
         mu = 1
         sigma = 1
-        a = (0 - mu) / sigma
-        ref_scores = truncnorm.logpdf(
-            psis, a=a, b=np.inf, loc=mu, scale=sigma)
+        ref_scores = _truncated_gaussian_ref_log_pdfs(
+            tuple(psis), mu, sigma)
 
         parameters = [mu, sigma]
         pw_scores = self.pop_model.compute_pointwise_ll(parameters, psis)
         score = self.pop_model.compute_log_likelihood(parameters, psis)
         self.assertEqual(len(pw_scores), 10)
         self.assertAlmostEqual(np.sum(pw_scores), score)
-        self.assertAlmostEqual(pw_scores[0], ref_scores[0])
-        self.assertAlmostEqual(pw_scores[1], ref_scores[1])
-        self.assertAlmostEqual(pw_scores[2], ref_scores[2])
-        self.assertAlmostEqual(pw_scores[3], ref_scores[3])
-        self.assertAlmostEqual(pw_scores[4], ref_scores[4])
-        self.assertAlmostEqual(pw_scores[5], ref_scores[5])
-        self.assertAlmostEqual(pw_scores[6], ref_scores[6])
-        self.assertAlmostEqual(pw_scores[7], ref_scores[7])
-        self.assertAlmostEqual(pw_scores[8], ref_scores[8])
-        self.assertAlmostEqual(pw_scores[9], ref_scores[9])
+        np.testing.assert_allclose(pw_scores, ref_scores, rtol=0, atol=1E-7)
 
         # Test case I.2:
         psis = np.linspace(3, 5, 10)
         mu = 2
         sigma = 4
-        a = (0 - mu) / sigma
-        ref_scores = truncnorm.logpdf(
-            psis, a=a, b=np.inf, loc=mu, scale=sigma)
+        ref_scores = _truncated_gaussian_ref_log_pdfs(
+            tuple(psis), mu, sigma)
 
         parameters = [mu, sigma]
         pw_scores = self.pop_model.compute_pointwise_ll(parameters, psis)
         score = self.pop_model.compute_log_likelihood(parameters, psis)
         self.assertEqual(len(pw_scores), 10)
         self.assertAlmostEqual(np.sum(pw_scores), score)
-        self.assertAlmostEqual(pw_scores[0], ref_scores[0])
-        self.assertAlmostEqual(pw_scores[1], ref_scores[1])
-        self.assertAlmostEqual(pw_scores[2], ref_scores[2])
-        self.assertAlmostEqual(pw_scores[3], ref_scores[3])
-        self.assertAlmostEqual(pw_scores[4], ref_scores[4])
-        self.assertAlmostEqual(pw_scores[5], ref_scores[5])
-        self.assertAlmostEqual(pw_scores[6], ref_scores[6])
-        self.assertAlmostEqual(pw_scores[7], ref_scores[7])
-        self.assertAlmostEqual(pw_scores[8], ref_scores[8])
-        self.assertAlmostEqual(pw_scores[9], ref_scores[9])
+        np.testing.assert_allclose(pw_scores, ref_scores, rtol=0, atol=1E-7)
 
         # Test case IV: mu_log or sigma_log negative or zero
 
         # Test case IV.1
-        psis = [np.exp(10)] * 3
+        psis = np.full(shape=3, fill_value=np.exp(10))
         mu = 1
         sigma = 0
 
@@ -1472,7 +1203,7 @@ class TestTruncatedGaussianModel(unittest.TestCase):
         self.assertEqual(scores[2], -np.inf)
 
         # Test case IV.2
-        psis = [np.exp(10)] * 3
+        psis = np.full(shape=3, fill_value=np.exp(10))
         mu = 1
         sigma = -10
 
@@ -1485,275 +1216,83 @@ class TestTruncatedGaussianModel(unittest.TestCase):
     def test_compute_sensitivities(self):
         n_ids = 10
 
-        # Test case I: psis = mu, sigma = 1
-        # Sensitivities reduce to
-        # dpsi = 0
-        # dmu = - phi(mu) * nids / (1 - Phi(-mu))
-        # dsigma = -n_ids + phi(mu) * mu * nids / (1 - Phi(-mu))
-
-        # Test case I.1:
-        psis = [1] * n_ids
-        mu = 1
-        sigma = 1
-
-        # Compute ref scores
-        parameters = [mu, sigma]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = 0
-        ref_dmu = -norm.pdf(mu) * n_ids / (1 - norm.cdf(-mu))
-        ref_dsigma = -n_ids + norm.pdf(mu) * mu * n_ids / (1 - norm.cdf(-mu))
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertAlmostEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertAlmostEqual(sens[0], ref_dpsi)
-        self.assertAlmostEqual(sens[1], ref_dpsi)
-        self.assertAlmostEqual(sens[2], ref_dpsi)
-        self.assertAlmostEqual(sens[3], ref_dpsi)
-        self.assertAlmostEqual(sens[4], ref_dpsi)
-        self.assertAlmostEqual(sens[5], ref_dpsi)
-        self.assertAlmostEqual(sens[6], ref_dpsi)
-        self.assertAlmostEqual(sens[7], ref_dpsi)
-        self.assertAlmostEqual(sens[8], ref_dpsi)
-        self.assertAlmostEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
-        # Test case I.2:
-        psis = [10] * n_ids
-        mu = 10
-        sigma = 1
-
-        # Compute ref scores
-        parameters = [mu, sigma]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = 0
-        ref_dmu = -norm.pdf(mu) * n_ids / (1 - norm.cdf(-mu))
-        ref_dsigma = -n_ids + norm.pdf(mu) * mu * n_ids / (1 - norm.cdf(-mu))
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertAlmostEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertAlmostEqual(sens[0], ref_dpsi)
-        self.assertAlmostEqual(sens[1], ref_dpsi)
-        self.assertAlmostEqual(sens[2], ref_dpsi)
-        self.assertAlmostEqual(sens[3], ref_dpsi)
-        self.assertAlmostEqual(sens[4], ref_dpsi)
-        self.assertAlmostEqual(sens[5], ref_dpsi)
-        self.assertAlmostEqual(sens[6], ref_dpsi)
-        self.assertAlmostEqual(sens[7], ref_dpsi)
-        self.assertAlmostEqual(sens[8], ref_dpsi)
-        self.assertAlmostEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
-        # Test case II: psis != mu, sigma = 1
-        # Sensitivities reduce to
-        # dpsi = mu - psi
-        # dmu = psi - mu - phi(mu) * nids / (1 - Phi(-mu))
-        # dsigma = (psi - mu)^2 - phi(mu) * mu * nids / (1 - Phi(-mu))
-
-        # Test case II.1:
-        psis = np.array([1] * n_ids)
-        mu = 10
-        sigma = 1
-
-        # Compute ref scores
-        parameters = [mu, sigma]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = mu - psis[0]
-        ref_dmu = \
-            np.sum(psis - mu) \
-            - norm.pdf(mu) * n_ids / (1 - norm.cdf(-mu))
-        ref_dsigma = \
-            - n_ids + np.sum((psis - mu)**2) \
-            + norm.pdf(mu) * mu * n_ids / (1 - norm.cdf(-mu))
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertAlmostEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertAlmostEqual(sens[0], ref_dpsi)
-        self.assertAlmostEqual(sens[1], ref_dpsi)
-        self.assertAlmostEqual(sens[2], ref_dpsi)
-        self.assertAlmostEqual(sens[3], ref_dpsi)
-        self.assertAlmostEqual(sens[4], ref_dpsi)
-        self.assertAlmostEqual(sens[5], ref_dpsi)
-        self.assertAlmostEqual(sens[6], ref_dpsi)
-        self.assertAlmostEqual(sens[7], ref_dpsi)
-        self.assertAlmostEqual(sens[8], ref_dpsi)
-        self.assertAlmostEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
-        # Test case II.2:
-        psis = np.array([7] * n_ids)
-        mu = 5
-        sigma = 1
-
-        # Compute ref scores
-        parameters = [mu, sigma]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = mu - psis[0]
-        ref_dmu = \
-            np.sum(psis - mu) \
-            - norm.pdf(mu) * n_ids / (1 - norm.cdf(-mu))
-        ref_dsigma = \
-            - n_ids + np.sum((psis - mu)**2) \
-            + norm.pdf(mu) * mu * n_ids / (1 - norm.cdf(-mu))
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertAlmostEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertAlmostEqual(sens[0], ref_dpsi)
-        self.assertAlmostEqual(sens[1], ref_dpsi)
-        self.assertAlmostEqual(sens[2], ref_dpsi)
-        self.assertAlmostEqual(sens[3], ref_dpsi)
-        self.assertAlmostEqual(sens[4], ref_dpsi)
-        self.assertAlmostEqual(sens[5], ref_dpsi)
-        self.assertAlmostEqual(sens[6], ref_dpsi)
-        self.assertAlmostEqual(sens[7], ref_dpsi)
-        self.assertAlmostEqual(sens[8], ref_dpsi)
-        self.assertAlmostEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
-        # Test case III: psis != mu, sigma != 1
-        # Sensitivities reduce to
-        # dpsi = (mu - psi) / sigma^2
-        # dmu =
-        #   (psi - mu - phi(mu/sigma) * nids / (1 - Phi(-mu/sigma))) / sigma
-        # dsigma =
-        #   -nids / sigma
-        #   + (psi - mu)^2 / sigma^3
-        #   + phi(mu) * mu * nids / (1 - Phi(-mu)) / sigma^2
-
-        # Test case III.1:
-        psis = np.array([1] * n_ids)
-        mu = 10
-        sigma = 2
-
-        # Compute ref scores
-        parameters = [mu, sigma]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = (mu - psis[0]) / sigma**2
-        ref_dmu = (
-            np.sum(psis - mu) / sigma
-            - norm.pdf(mu/sigma) * n_ids / (1 - norm.cdf(-mu/sigma))
-            ) / sigma
-        ref_dsigma = (
-            -n_ids + np.sum((psis - mu)**2) / sigma**2
-            + norm.pdf(mu/sigma) * mu / sigma * n_ids /
-            (1 - norm.cdf(-mu/sigma))
-        ) / sigma
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertAlmostEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertAlmostEqual(sens[0], ref_dpsi)
-        self.assertAlmostEqual(sens[1], ref_dpsi)
-        self.assertAlmostEqual(sens[2], ref_dpsi)
-        self.assertAlmostEqual(sens[3], ref_dpsi)
-        self.assertAlmostEqual(sens[4], ref_dpsi)
-        self.assertAlmostEqual(sens[5], ref_dpsi)
-        self.assertAlmostEqual(sens[6], ref_dpsi)
-        self.assertAlmostEqual(sens[7], ref_dpsi)
-        self.assertAlmostEqual(sens[8], ref_dpsi)
-        self.assertAlmostEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma, 5)
-
-        # Test case III.2:
-        psis = np.array([7] * n_ids)
-        mu = 0.5
-        sigma = 0.1
-
-        # Compute ref scores
-        parameters = [mu, sigma]
-        ref_ll = self.pop_model.compute_log_likelihood(parameters, psis)
-        ref_dpsi = (mu - psis[0]) / sigma**2
-        ref_dmu = (
-            np.sum(psis - mu) / sigma
-            - norm.pdf(mu/sigma) * n_ids / (1 - norm.cdf(-mu/sigma))
-            ) / sigma
-        ref_dsigma = (
-            -n_ids + np.sum((psis - mu)**2) / sigma**2
-            + norm.pdf(mu/sigma) * mu / sigma * n_ids /
-            (1 - norm.cdf(-mu/sigma))
-        ) / sigma
-
-        # Compute log-likelihood and sensitivities
-        score, sens = self.pop_model.compute_sensitivities(parameters, psis)
-
-        self.assertAlmostEqual(score, ref_ll)
-        self.assertEqual(len(sens), n_ids + 2)
-        self.assertAlmostEqual(sens[0], ref_dpsi)
-        self.assertAlmostEqual(sens[1], ref_dpsi)
-        self.assertAlmostEqual(sens[2], ref_dpsi)
-        self.assertAlmostEqual(sens[3], ref_dpsi)
-        self.assertAlmostEqual(sens[4], ref_dpsi)
-        self.assertAlmostEqual(sens[5], ref_dpsi)
-        self.assertAlmostEqual(sens[6], ref_dpsi)
-        self.assertAlmostEqual(sens[7], ref_dpsi)
-        self.assertAlmostEqual(sens[8], ref_dpsi)
-        self.assertAlmostEqual(sens[9], ref_dpsi)
-        self.assertAlmostEqual(sens[10], ref_dmu)
-        self.assertAlmostEqual(sens[11], ref_dsigma)
-
-        # Test case IV: Compare gradients to numpy.gradient
+        # Each case is defined by (psi, mu, sigma, places), where places is
+        # the number of decimal places to which the sigma sensitivity is
+        # compared. The references use the general expressions of case III,
+        # which reduce to those of cases I and II
+        cases = [
+            # Test case I: psis = mu, sigma = 1
+            # Sensitivities reduce to
+            # dpsi = 0
+            # dmu = - phi(mu) * nids / (1 - Phi(-mu))
+            # dsigma = -n_ids + phi(mu) * mu * nids / (1 - Phi(-mu))
+            (1.0, 1, 1, 7), (10.0, 10, 1, 7),
+
+            # Test case II: psis != mu, sigma = 1
+            # Sensitivities reduce to
+            # dpsi = mu - psi
+            # dmu = psi - mu - phi(mu) * nids / (1 - Phi(-mu))
+            # dsigma = (psi - mu)^2 - phi(mu) * mu * nids / (1 - Phi(-mu))
+            (1.0, 10, 1, 7), (7.0, 5, 1, 7),
+
+            # Test case III: psis != mu, sigma != 1
+            # Sensitivities reduce to
+            # dpsi = (mu - psi) / sigma^2
+            # dmu =
+            #   (psi - mu - phi(mu/sigma) * nids / (1 - Phi(-mu/sigma)))
+            #   / sigma
+            # dsigma =
+            #   -nids / sigma
+            #   + (psi - mu)^2 / sigma^3
+            #   + phi(mu) * mu * nids / (1 - Phi(-mu)) / sigma^2
+            (1.0, 10, 2, 5), (7.0, 0.5, 0.1, 7)]
+        for psi, mu, sigma, places in cases:
+            with self.subTest(psi=psi, mu=mu, sigma=sigma):
+                psis = np.full(shape=n_ids, fill_value=psi)
+
+                # Compute ref scores
+                parameters = [mu, sigma]
+                ref_ll = self.pop_model.compute_log_likelihood(
+                    parameters, psis)
+                ratio = _truncated_gaussian_ratio(mu, sigma)
+                ref_dpsi = (mu - psi) / sigma**2
+                ref_dmu = (
+                    np.sum(psis - mu) / sigma - ratio * n_ids) / sigma
+                ref_dsigma = (
+                    -n_ids + np.sum((psis - mu)**2) / sigma**2
+                    + ratio * mu / sigma * n_ids) / sigma
+
+                # Compute log-likelihood and sensitivities
+                score, sens = self.pop_model.compute_sensitivities(
+                    parameters, psis)
+
+                self.assertAlmostEqual(score, ref_ll)
+                self.assertEqual(len(sens), n_ids + 2)
+                np.testing.assert_allclose(
+                    sens[:n_ids], np.full(shape=n_ids, fill_value=ref_dpsi),
+                    rtol=0, atol=1E-7)
+                self.assertAlmostEqual(sens[10], ref_dmu)
+                self.assertAlmostEqual(sens[11], ref_dsigma, places)
+
+        # Test case IV: Compare gradients to central finite differences
         epsilon = 0.001
-        n_parameters = n_ids + self.pop_model.n_parameters()
-        parameters = np.ones(shape=n_parameters)
-        ref_sens = []
-        for index in range(n_parameters):
-            # Construct parameter grid
-            low = parameters.copy()
-            low[index] -= epsilon
-            high = parameters.copy()
-            high[index] += epsilon
-
-            # Compute reference using numpy.gradient
-            sens = np.gradient(
-                [
-                    self.pop_model.compute_log_likelihood(
-                        low[n_ids:], low[:n_ids]),
-                    self.pop_model.compute_log_likelihood(
-                        parameters[n_ids:], parameters[:n_ids]),
-                    self.pop_model.compute_log_likelihood(
-                        high[n_ids:], high[:n_ids])],
-                (epsilon))
-            ref_sens.append(sens[1])
+        psis = self.parameters[:n_ids]
+        pop_parameters = self.parameters[n_ids:]
+
+        ref_sens = _finite_difference_sensitivities(
+            self.pop_model, pop_parameters, psis, epsilon)
 
         # Compute sensitivities with hierarchical model
-        _, sens = self.pop_model.compute_sensitivities(
-            parameters[n_ids:], parameters[:n_ids])
+        _, sens = self.pop_model.compute_sensitivities(pop_parameters, psis)
 
         self.assertEqual(len(sens), 12)
-        self.assertEqual(sens[0], ref_sens[0])
-        self.assertEqual(sens[1], ref_sens[1])
-        self.assertEqual(sens[2], ref_sens[2])
-        self.assertEqual(sens[3], ref_sens[3])
-        self.assertEqual(sens[4], ref_sens[4])
-        self.assertEqual(sens[5], ref_sens[5])
-        self.assertEqual(sens[6], ref_sens[6])
-        self.assertEqual(sens[7], ref_sens[7])
-        self.assertEqual(sens[8], ref_sens[8])
-        self.assertEqual(sens[9], ref_sens[9])
+        np.testing.assert_array_equal(sens[:n_ids], ref_sens[:n_ids])
         self.assertAlmostEqual(sens[10], ref_sens[10], 5)
         self.assertAlmostEqual(sens[11], ref_sens[11], 5)
 
         # Test case V: mu_log or sigma_log negative or zero
         # Test case V.1
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = 0
 
@@ -1765,7 +1304,7 @@ class TestTruncatedGaussianModel(unittest.TestCase):
         self.assertEqual(sens[2], np.inf)
 
         # Test case V.2
-        psis = [np.exp(10)] * n_ids
+        psis = np.full(shape=n_ids, fill_value=np.exp(10))
         mu = 1
         sigma = -10
 
@@ -1853,34 +1392,40 @@ class TestTruncatedGaussianModel(unittest.TestCase):
         self.assertEqual(self.pop_model.get_parameter_names(), names)
 
     def test_n_hierarchical_parameters(self):
-        n_ids = 10
-        n_hierarchical_params = self.pop_model.n_hierarchical_parameters(n_ids)
-
-        self.assertEqual(len(n_hierarchical_params), 2)
-        self.assertEqual(n_hierarchical_params[0], n_ids)
-        self.assertEqual(n_hierarchical_params[1], 2)
+        _check_n_hierarchical_parameters(
+            self, self.pop_model, n_indiv_per_id=1, n_pop=2)
 
     def test_n_parameters(self):
         self.assertEqual(self.pop_model.n_parameters(), 2)
 
     def test_sample(self):
-        # Test I: sample size 1
-        seed = np.random.default_rng(seed=42)
-        parameters = [3, 2]
-        sample = self.pop_model.sample(parameters, seed=seed)
-
-        n_samples = 1
-        self.assertEqual(sample.shape, (n_samples,))
-
-        # Test II: sample size > 1
-        seed = 1
+        # Each case is defined by (n_samples, seed): a single sample, several
+        # samples, and several samples seeded by an integer rather than a
+        # generator
         parameters = [3, 2]
-        n_samples = 4
-        sample = self.pop_model.sample(
-            parameters, n_samples=n_samples, seed=seed)
-
-        self.assertEqual(
-            sample.shape, (n_samples,))
+        cases = [(None, self.rng), (4, self.rng), (4, 1)]
+        for n_samples, seed in cases:
+            with self.subTest(n_samples=n_samples, seed=seed):
+                sample = self.pop_model.sample(
+                    parameters, n_samples=n_samples, seed=seed)
+
+                n_ref = 1 if n_samples is None else n_samples
+                self.assertEqual(sample.shape, (n_ref,))
+
+        # The same integer seed returns the same samples
+        samples = self.pop_model.sample(parameters, n_samples=10, seed=1)
+        ref_samples = self.pop_model.sample(parameters, n_samples=10, seed=1)
+        np.testing.assert_array_equal(samples, ref_samples)
+
+        # Sampling leaves numpy's global random state unchanged
+        ref_state = np.random.get_state()
+        self.pop_model.sample(
+            parameters, n_samples=10, seed=np.random.default_rng(seed=2))
+        self.pop_model.sample(parameters, n_samples=10, seed=3)
+        state = np.random.get_state()
+        self.assertEqual(state[0], ref_state[0])
+        np.testing.assert_array_equal(state[1], ref_state[1])
+        self.assertEqual(state[2:], ref_state[2:])
 
     def test_sample_bad_input(self):
         # Too many paramaters
@@ -1896,6 +1441,8 @@ class TestTruncatedGaussianModel(unittest.TestCase):
             self.pop_model.sample(parameters)
 
     def test_set_parameter_names(self):
+        self.addCleanup(self.pop_model.set_parameter_names, None)
+
         # Test some name
         names = ['test', 'name']
         self.pop_model.set_parameter_names(names)
@@ -1907,9 +1454,7 @@ class TestTruncatedGaussianModel(unittest.TestCase):
         self.pop_model.set_parameter_names(None)
         names = self.pop_model.get_parameter_names()
 
-        self.assertEqual(len(names), 2)
-        self.assertEqual(names[0], 'Mu')
-        self.assertEqual(names[1], 'Sigma')
+        self.assertEqual(names, ['Mu', 'Sigma'])
 
     def test_set_parameter_names_bad_input(self):
         # Wrong number of names
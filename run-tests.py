@@ -271,6 +271,45 @@ def run_unit_tests():
     sys.exit(0 if res.wasSuccessful() else 1)
 
 
+def run_unit_tests_in_parallel():
+    """
+    Runs unit tests in parallel using ``pytest-xdist``.
+
+    Tests are distributed across workers with ``--dist=loadscope``, so each
+    worker runs whole test classes and every ``setUpClass`` is executed only
+    once. ``pytest`` and ``pytest-xdist`` are installed with the ``dev``
+    extra, i.e. ``pip install -e .[dev]``.
+    """
+    import importlib.util
+    if importlib.util.find_spec('xdist') is None:
+        print('Running tests in parallel requires pytest-xdist. Install it '
+              'with `pip install -e .[dev]`.')
+        print('FAILED')
+        sys.exit(1)
+
+    tests = os.path.join('erlotinib', 'tests')
+    p = subprocess.Popen([
+        sys.executable,
+        '-m',
+        'pytest',
+        '-n',
+        'auto',
+        '--dist=loadscope',
+        tests,
+    ])
+    try:
+        ret = p.wait()
+    except KeyboardInterrupt:
+        try:
+            p.terminate()
+        except OSError:
+            pass
+        p.wait()
+        print('')
+        sys.exit(1)
+    sys.exit(ret)
+
+
 if __name__ == '__main__':
     # Set up argument parsing
     parser = argparse.ArgumentParser(
@@ -283,6 +322,10 @@ if __name__ == '__main__':
         '--unit',
         action='store_true',
         help='Run all unit tests using the `python` interpreter.',)
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Run all unit tests in parallel using `pytest-xdist`.',)
 
     # Copyright checks
     parser.add_argument(
@@ -308,6 +351,11 @@ if __name__ == '__main__':
         has_run = True
         run_unit_tests()
 
+    # Parallel unit tests
+    if args.parallel:
+        has_run = True
+        run_unit_tests_in_parallel()
+
     # Copyright checks
     if args.copyright:
         has_run = True
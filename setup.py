@@ -39,5 +39,9 @@ setup(
             'furo',
             'sphinx>=1.5, !=1.7.3',     # For doc generation
         ],
+        'dev': [
+            'pytest',
+            'pytest-xdist',             # For parallel unit tests
+        ],
     },
 )